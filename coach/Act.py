@@ -3,6 +3,7 @@ import cv2
 import numpy as np
 import random
 import pyttsx3
+from coach.PhraseCache import PhraseCache
 
 class Act:
 
@@ -13,6 +14,7 @@ class Act:
         self.rocket_ready = False  # Track if the rocket is ready for launch
         self.rocket_launched = False
         self.engine = pyttsx3.init()
+        self.voice = PhraseCache(self.engine)
 
         # Rocket visuals
         self.rocket_position = 400  # Initial vertical position (ground)
@@ -21,6 +23,18 @@ class Act:
 
         self.motivational_phrases = ['Ignition set!', 'Rocket is heating up!', 'Almost ready to launch!', 'Countdown starting soon!']
 
+        # Render the spoken prompts ahead of time so they play back without synthesis delay
+        self.voice.render(self.spoken_phrases())
+
+    def spoken_phrases(self):
+        """
+        Lists every prompt Act can speak for the current max_reps.
+        """
+        phrases = [f"{reps} reps: {text}" for reps in range(1, self.max_reps) for text in self.motivational_phrases]
+        phrases += [f"Countdown: {remaining}" for remaining in range(1, 4)]
+        phrases.append("Lift off! The rocket is launching!")
+        return phrases
+
     def handle_rep_increase(self):
         """
         Increase the repetition count and update the rocket's state.
@@ -32,8 +46,7 @@ class Act:
             else:
                 self.display_progress()
                 text = random.choice(self.motivational_phrases)
-                self.engine.say(f"{self.rep_count} reps: {text}")
-                self.engine.runAndWait()
+                self.voice.say(f"{self.rep_count} reps: {text}")
 
     def display_progress(self):
         """
@@ -41,8 +54,7 @@ class Act:
         """
         if self.rep_count >= self.max_reps - 3:
             # Show countdown effect as rocket approaches launch
-            self.engine.say(f"Countdown: {self.max_reps - self.rep_count}")
-            self.engine.runAndWait()
+            self.voice.say(f"Countdown: {self.max_reps - self.rep_count}")
 
     def launch_rocket(self):
         """
@@ -50,8 +62,7 @@ class Act:
         """
         self.rocket_ready = True
         self.launch_flames = True  # Display flames during launch
-        self.engine.say("Lift off! The rocket is launching!")
-        self.engine.runAndWait()
+        self.voice.say("Lift off! The rocket is launching!")
 
     def visualize_rocket(self):
         """
@@ -0,0 +1,333 @@
+import json
+import os
+import time
+from collections import deque
+import cv2
+
+# Capture Component: Webcam profiles with format, resolution and buffer negotiation
+
+# Profiles in order of preference. MediaPipe Pose does not need more than 640x480,
+# and MJPG keeps USB bandwidth and driver-side conversion cost low.
+PROFILES = [
+    {'name': 'mjpg-640x480-30', 'fourcc': 'MJPG', 'width': 640, 'height': 480, 'fps': 30, 'buffer_size': 1},
+    {'name': 'yuyv-640x480-30', 'fourcc': 'YUYV', 'width': 640, 'height': 480, 'fps': 30, 'buffer_size': 1},
+    {'name': 'mjpg-960x540-30', 'fourcc': 'MJPG', 'width': 960, 'height': 540, 'fps': 30, 'buffer_size': 1},
+    {'name': 'mjpg-1280x720-30', 'fourcc': 'MJPG', 'width': 1280, 'height': 720, 'fps': 30, 'buffer_size': 1},
+    {'name': 'default', 'fourcc': None, 'width': None, 'height': None, 'fps': None, 'buffer_size': None}
+]
+
+PROFILE_CACHE = 'coach/assets/capture_profiles.json'
+
+PROBE_FRAMES = 30  # Frames timed per profile while probing
+
+MAX_BUFFER_FLUSH = 8  # Frames flushed at most when the driver does not report its buffer depth
+
+
+def decode_fourcc(value):
+    value = int(value)
+    return ''.join(chr((value >> (8 * i)) & 0xFF) for i in range(4))
+
+
+class Camera:
+
+    def __init__(self, device=0, profile=None, probe=None):
+        """
+        Opens a webcam with a capture profile. Stands in for cv2.VideoCapture in the
+        exercise loop and drops stale buffered frames on every read.
+        """
+        self.device = device
+        self.profile = profile if profile is not None else PROFILES[-1]
+        self.probe = probe  # Measured result from probing this profile, if known
+        self.cap = cv2.VideoCapture(device)
+
+        # Driver buffer depth; stays unknown if the backend ignores CAP_PROP_BUFFERSIZE
+        self.buffer_size = None
+
+        # Runtime statistics
+        self.grab_times = deque(maxlen=120)  # (wall clock, CAP_PROP_POS_MSEC) for every grabbed frame
+        self.read_times = deque(maxlen=60)
+        self.read_waits = deque(maxlen=60)
+        self.frame_ages = deque(maxlen=60)  # Age of each frame when read() returns it
+        self.age_source = None
+        self.clock_offset = None  # Our clock minus the driver timestamp, smallest seen
+        self.last_read = None
+        self.frames = 0
+        self.dropped_frames = 0
+
+        if self.cap.isOpened():
+            self.apply_profile()
+
+    def set_property(self, prop, value, name):
+        if not self.cap.set(prop, value):
+            print(f"Camera {self.device}: driver rejected {name}={value}")
+            return False
+        return True
+
+    def apply_profile(self):
+        """
+        Sets the profile on the device. FOURCC goes first, since some drivers only
+        offer certain resolutions for a given pixel format.
+        """
+        profile = self.profile
+        if profile['fourcc']:
+            self.set_property(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*profile['fourcc']), 'fourcc')
+        if profile['width']:
+            self.set_property(cv2.CAP_PROP_FRAME_WIDTH, profile['width'], 'width')
+            self.set_property(cv2.CAP_PROP_FRAME_HEIGHT, profile['height'], 'height')
+        if profile['fps']:
+            self.set_property(cv2.CAP_PROP_FPS, profile['fps'], 'fps')
+        if profile['buffer_size'] and self.set_property(cv2.CAP_PROP_BUFFERSIZE, profile['buffer_size'], 'buffer_size'):
+            actual = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+            if actual > 0:
+                self.buffer_size = actual
+
+    def negotiated(self):
+        """
+        Returns what the device actually agreed to, which can differ from the profile.
+        """
+        buffer_size = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+        return {
+            'fourcc': decode_fourcc(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            'width': int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': self.cap.get(cv2.CAP_PROP_FPS),
+            'buffer_size': buffer_size if buffer_size > 0 else None
+        }
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def grab(self):
+        if not self.cap.grab():
+            return False
+        wall, pos = time.perf_counter(), self.cap.get(cv2.CAP_PROP_POS_MSEC)
+        self.grab_times.append((wall, pos))
+
+        # A frame can only be grabbed after it arrived, so the smallest gap between
+        # grab time and driver timestamp maps the driver clock onto ours
+        if pos > 0:
+            offset = wall - pos / 1000
+            if self.clock_offset is None or offset < self.clock_offset:
+                self.clock_offset = offset
+        return True
+
+    def frame_arrival(self):
+        """
+        Estimates when the last grabbed frame arrived from the camera, on the
+        time.perf_counter() clock. Uses the driver timestamp where the backend
+        provides one, otherwise the time of the grab that produced the frame.
+        """
+        wall, pos = self.grab_times[-1]
+        if pos > 0 and self.clock_offset is not None:
+            self.age_source = 'driver timestamps'
+            return pos / 1000 + self.clock_offset
+        self.age_source = 'grab times, a lower bound for buffered frames'
+        return wall
+
+    def read(self):
+        """
+        Grabs every frame that piled up in the driver buffer since the last read and
+        decodes only the newest one.
+
+        The number of buffered frames is estimated from the time since the last read,
+        capped by the buffer depth (or MAX_BUFFER_FLUSH if the driver does not report
+        it). One grab more than that is allowed, so a buffer full of old frames is
+        followed by a fresh one. A grab that has to wait for the camera means the
+        buffer is empty, so the flush stops there and that frame is used.
+        """
+        fps = self.negotiated_fps()
+        depth = self.buffer_size or MAX_BUFFER_FLUSH
+
+        start = time.perf_counter()
+        buffered = 0
+        if self.last_read is not None:
+            buffered = min(depth, int((start - self.last_read) * fps))
+
+        for grabbed in range(buffered + 1):
+            grab_start = time.perf_counter()
+            if not self.grab():
+                return False, None
+            if grabbed:
+                self.dropped_frames += 1  # The previous grab is replaced by this one
+            if time.perf_counter() - grab_start >= 0.5 / fps:
+                break  # Waited for the camera, so this frame is fresh
+
+        arrival = self.frame_arrival()
+        ret, frame = self.cap.retrieve()
+        now = time.perf_counter()
+        self.last_read = now
+        if ret:
+            self.frames += 1
+            self.read_times.append(now)
+            self.read_waits.append(now - start)
+            self.frame_ages.append(now - arrival)
+        return ret, frame
+
+    def negotiated_fps(self):
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        if fps and fps > 0:
+            return fps
+        return self.profile['fps'] or 30
+
+    def grab_rate(self):
+        """
+        Frames per second handed over by the driver, including frames dropped as stale.
+        Uses the driver's frame timestamps where available, otherwise grab times.
+        Frames the driver discards itself while its buffer is full never reach us, so
+        this equals the camera rate only when reads keep up, as they do while probing.
+        """
+        if len(self.grab_times) < 2:
+            return 0.0
+        (first_wall, first_pos), (last_wall, last_pos) = self.grab_times[0], self.grab_times[-1]
+        if first_pos > 0 and last_pos > first_pos:
+            return (len(self.grab_times) - 1) / ((last_pos - first_pos) / 1000)
+        if last_wall > first_wall:
+            return (len(self.grab_times) - 1) / (last_wall - first_wall)
+        return 0.0
+
+    def processing_rate(self):
+        """Frames per second actually read by the caller, e.g. the exercise loop."""
+        if len(self.read_times) < 2:
+            return 0.0
+        return (len(self.read_times) - 1) / (self.read_times[-1] - self.read_times[0])
+
+    def frame_age(self):
+        """
+        Average age of the frames returned by read(), from their arrival at the
+        driver to the moment read() returns them, in seconds. This is the capture
+        latency the exercise loop sees. Sensor exposure and USB transfer before the
+        driver timestamp are not included.
+        """
+        if not self.frame_ages:
+            return 0.0
+        return sum(self.frame_ages) / len(self.frame_ages)
+
+    def read_wait(self):
+        """
+        Average time spent inside read() waiting for, flushing and decoding a frame,
+        in seconds. This is not the capture-to-display latency.
+        """
+        if not self.read_waits:
+            return 0.0
+        return sum(self.read_waits) / len(self.read_waits)
+
+    def report(self):
+        """
+        Prints the profile, the negotiated format, the camera and processing rates,
+        the capture latency and the time waited in read().
+        """
+        settings = self.negotiated() if self.cap.isOpened() else {}
+        print(f"Camera {self.device}: profile {self.profile['name']}, negotiated {settings}")
+        if self.probe:
+            print(f"When probed: camera rate {self.probe.get('camera_rate', 0.0):.1f} fps, "
+                  f"capture latency {1000 * self.probe.get('frame_age', float('nan')):.1f} ms")
+        print(f"Grab rate: {self.grab_rate():.1f} fps, processing rate: {self.processing_rate():.1f} fps")
+        print(f"Capture latency (frame age at read, from {self.age_source}): {1000 * self.frame_age():.1f} ms, "
+              f"time waited in read(): {1000 * self.read_wait():.1f} ms")
+        print(f"Frames read: {self.frames}, stale frames dropped: {self.dropped_frames}")
+
+    def release(self):
+        self.report()
+        self.cap.release()
+
+
+def probe_profile(device, profile):
+    """
+    Opens the device with one profile and times a burst of frames.
+    Returns the measured result, or None if the profile does not work.
+    """
+    camera = Camera(device, profile)
+    if not camera.isOpened():
+        return None
+
+    try:
+        settings = camera.negotiated()
+        if profile['fourcc'] and settings['fourcc'] != profile['fourcc']:
+            return None
+        if profile['width'] and (settings['width'], settings['height']) != (profile['width'], profile['height']):
+            return None
+
+        # The first frames after opening are slow while the camera starts streaming
+        for _ in range(5):
+            if not camera.read()[0]:
+                return None
+        camera.grab_times.clear()
+        camera.read_waits.clear()
+        camera.frame_ages.clear()
+
+        # Read back to back, so every frame the camera delivers is grabbed
+        for _ in range(PROBE_FRAMES):
+            if not camera.read()[0]:
+                return None
+
+        # Reads keep up with the camera here, so the grab rate is the camera rate
+        return {'profile': profile['name'], 'camera_rate': camera.grab_rate(),
+                'read_wait': camera.read_wait(), 'frame_age': camera.frame_age(), **settings}
+    finally:
+        camera.cap.release()
+
+
+def probe_device(device=0):
+    """
+    Tries the profiles in order of preference and returns the best working one.
+    A profile that reaches 90% of its target rate wins right away; otherwise the
+    fastest measured profile is used.
+    """
+    results = []
+    for profile in PROFILES:
+        result = probe_profile(device, profile)
+        if result is None:
+            print(f"Camera {device}: profile {profile['name']} not supported")
+            continue
+
+        print(f"Camera {device}: profile {profile['name']} ran at {result['camera_rate']:.1f} fps, "
+              f"capture latency {1000 * result['frame_age']:.1f} ms")
+        results.append(result)
+        if profile['fps'] and result['camera_rate'] >= 0.9 * profile['fps']:
+            return result
+
+    if not results:
+        return None
+    return max(results, key=lambda result: result['camera_rate'])
+
+
+def load_profile_cache(cache_path=PROFILE_CACHE):
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_profile_cache(cache, cache_path=PROFILE_CACHE):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+
+def open_camera(device=0, cache_path=PROFILE_CACHE, reprobe=False):
+    """
+    Opens a webcam with the best profile for it. The probe result is cached per
+    device, so only the first run pays for probing. If the cached profile stops
+    working, the device is probed again.
+    """
+    profiles = {profile['name']: profile for profile in PROFILES}
+    cache = load_profile_cache(cache_path)
+    cached = cache.get(str(device))
+
+    if cached and not reprobe and cached['profile'] in profiles:
+        camera = Camera(device, profiles[cached['profile']], cached)
+        if camera.isOpened() and camera.read()[0]:
+            return camera
+        camera.cap.release()
+        print(f"Camera {device}: cached profile {cached['profile']} failed, probing again")
+
+    result = probe_device(device)
+    if result is None:
+        # Nothing worked; hand back a plain capture so the caller reports the error
+        return Camera(device)
+
+    cache[str(device)] = result
+    save_profile_cache(cache, cache_path)
+    print(f"Camera {device}: using profile {result['profile']}")
+    return Camera(device, profiles[result['profile']], result)
@@ -0,0 +1,148 @@
+import hashlib
+import os
+import wave
+import numpy as np
+import pyttsx3
+
+# sounddevice needs the PortAudio library; without it every phrase is spoken live
+try:
+    import sounddevice as sd
+except (ImportError, OSError) as e:
+    print(f"Audio playback unavailable, phrases will be synthesized live: {e}")
+    sd = None
+
+
+def read_wav(path):
+    """
+    Reads a 16-bit WAV file. Raises ValueError if the file is not one or is truncated.
+    """
+    try:
+        with wave.open(path, 'rb') as wav:
+            sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            frame_count = wav.getnframes()
+            data = wav.readframes(frame_count)
+    except (wave.Error, EOFError, OSError) as e:
+        raise ValueError(f"not a readable WAV file ({e})")
+
+    if sample_width != 2:
+        raise ValueError(f"unsupported sample width {sample_width}")
+    if frame_count == 0 or len(data) < frame_count * channels * sample_width:
+        raise ValueError("file is empty or truncated")
+
+    samples = np.frombuffer(data, dtype=np.int16)
+    return samples.reshape(-1, channels), sample_rate
+
+
+# PhraseCache Component: Pre-synthesized speech for the coaching prompts
+class PhraseCache:
+
+    def __init__(self, engine=None, cache_dir='coach/assets/phrases'):
+        """
+        Renders known phrases to WAV files with the offline pyttsx3 engine and plays
+        them back through sounddevice. Phrases that are not cached are spoken live.
+        """
+        self.engine = engine if engine is not None else pyttsx3.init()
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Written when the engine does not produce WAV files (e.g. AIFF from macOS nsss)
+        self.unsupported_marker = os.path.join(self.cache_dir, 'unsupported')
+
+        # Decoded audio kept in memory after the first playback
+        self.loaded = {}
+        # Phrases that failed to load or play, so the error is only printed once
+        self.failed = set()
+
+    def phrase_path(self, text):
+        """
+        Returns the cache file for a phrase. The voice and rate are part of the key so
+        that changing the engine settings renders the phrases again.
+        """
+        key = f"{self.engine.getProperty('voice')}|{self.engine.getProperty('rate')}|{text}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.wav")
+
+    def render(self, phrases):
+        """
+        Synthesizes every phrase that does not have a cache file yet.
+        Already rendered phrases are skipped, so this is cheap after the first run.
+        Rendered files that are not valid WAV are deleted again.
+        """
+        if sd is None or os.path.exists(self.unsupported_marker):
+            return
+
+        missing = [text for text in dict.fromkeys(phrases) if not os.path.exists(self.phrase_path(text))]
+        if not missing:
+            return
+
+        for text in missing:
+            self.engine.save_to_file(text, self.phrase_path(text))
+        self.engine.runAndWait()
+
+        invalid = []
+        last_error = None
+        for text in missing:
+            path = self.phrase_path(text)
+            try:
+                read_wav(path)
+            except ValueError as e:
+                invalid.append(text)
+                last_error = e
+                if os.path.exists(path):
+                    os.remove(path)
+
+        if len(invalid) == len(missing):
+            # Nothing usable came out, so the engine writes some other format
+            print(f"Speech engine did not produce WAV files ({last_error}), phrases will be synthesized live")
+            with open(self.unsupported_marker, 'w') as f:
+                f.write(f"{last_error}\n")
+            return
+
+        print(f"Rendered {len(missing) - len(invalid)} phrases to {self.cache_dir}")
+        if invalid:
+            print(f"Discarded {len(invalid)} phrases that did not render to valid WAV files")
+
+    def load(self, text):
+        """
+        Reads a cached phrase into memory. Returns None if it is not cached or unreadable.
+        """
+        if text in self.loaded:
+            return self.loaded[text]
+        if text in self.failed:
+            return None
+
+        path = self.phrase_path(text)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            audio = read_wav(path)
+        except ValueError as e:
+            print(f"Error loading cached phrase '{text}': {e}")
+            self.failed.add(text)
+            return None
+
+        self.loaded[text] = audio
+        return audio
+
+    def say(self, text):
+        """
+        Speaks a phrase, from the cache when possible and with live synthesis otherwise.
+        Blocks until playback is finished, like pyttsx3's runAndWait.
+        """
+        audio = self.load(text) if sd is not None else None
+        if audio is not None:
+            try:
+                samples, sample_rate = audio
+                sd.play(samples, sample_rate)
+                sd.wait()
+                return
+            except sd.PortAudioError as e:
+                print(f"Error playing cached phrase '{text}': {e}")
+                self.loaded.pop(text, None)
+                self.failed.add(text)
+
+        self.engine.say(text)
+        self.engine.runAndWait()
@@ -0,0 +1,262 @@
+import argparse
+import asyncio
+import math
+import os
+import select
+import socket
+import struct
+import sys
+import time
+from collections import deque
+
+# Let `python coach/Stream.py` find the coach package, the same as `python -m coach.Stream`
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from coach.Think import Think
+
+# Stream Component: Split mode where thin clients stream landmarks and one server runs Think
+
+# Joints sent for every frame, in wire order (x, y for each)
+JOINTS = ['left_shoulder', 'left_elbow', 'left_wrist', 'left_hip', 'left_knee', 'left_ankle']
+
+EXERCISES = ['arm', 'leg', 'sit-stand']
+STATES = ['neutral', 'flexion', 'extension', 'sitting', 'standing']
+
+# Wire formats (little endian)
+HELLO = struct.Struct('<B')  # exercise index, sent once after connecting
+FRAME = struct.Struct('<I12f')  # frame number, then x, y for each joint
+UPDATE = struct.Struct('<IBIf')  # frame number, state index, rep count, angle
+
+DEFAULT_PORT = 8765
+
+FINISHED_SESSIONS = 1000  # Summaries of closed sessions kept in memory
+
+
+def joint_angle(joint1, joint2, joint3):
+    """
+    Calculates the angle at joint2 in degrees, the same way Sense does.
+    """
+    vector1 = (joint1[0] - joint2[0], joint1[1] - joint2[1])
+    vector2 = (joint3[0] - joint2[0], joint3[1] - joint2[1])
+
+    dot_product = vector1[0] * vector2[0] + vector1[1] * vector2[1]
+    magnitude1 = math.hypot(*vector1)
+    magnitude2 = math.hypot(*vector2)
+
+    return math.degrees(math.acos(dot_product / (magnitude1 * magnitude2 + 1e-7)))
+
+
+class SessionAct:
+    """
+    Stand-in for Act on the server: counts reps without speech or windows.
+    The client's own Act does the talking when it receives the update.
+    """
+
+    def __init__(self):
+        self.rep_count = 0
+        self.last_message = None
+
+    def handle_rep_increase(self):
+        self.rep_count += 1
+
+    def visual_feedback(self, message):
+        self.last_message = message
+
+
+class LandmarkSession:
+
+    def __init__(self, exercise_type, flexion_threshold=90, extension_threshold=120):
+        """
+        Holds one client's rep counter and analytics.
+        """
+        self.exercise_type = exercise_type
+        self.act = SessionAct()
+        self.think = Think(self.act, exercise_type=exercise_type, flexion_threshold=flexion_threshold,
+                           extension_threshold=extension_threshold, debug=False)
+
+        # Moving average filter, seeded like Sense
+        self.angle_window = deque([-1] * 10, maxlen=10)
+
+        # Analytics
+        self.started = time.time()
+        self.frames = 0
+        self.min_angle = None
+        self.max_angle = None
+
+    def smoothed(self, window, angle):
+        window.append(angle)
+        return sum(window) / len(window)
+
+    def process(self, values):
+        """
+        Runs one frame of joint coordinates through Think.
+        Returns (state, reps, angle) when the state changed, otherwise None.
+        """
+        joints = dict(zip(JOINTS, zip(values[0::2], values[1::2])))
+        previous_state = self.think.state
+
+        if self.exercise_type == 'arm':
+            angle = self.smoothed(self.angle_window, joint_angle(joints['left_shoulder'], joints['left_elbow'], joints['left_wrist']))
+            self.think.update_state(angle)
+        elif self.exercise_type == 'leg':
+            angle = self.smoothed(self.angle_window, joint_angle(joints['left_hip'], joints['left_knee'], joints['left_ankle']))
+            self.think.update_state(angle)
+        else:
+            # Same as local run_exercise: both angles come from hip-knee-ankle and
+            # go through one shared window, so reps match with and without --server
+            knee_angle = joint_angle(joints['left_hip'], joints['left_knee'], joints['left_ankle'])
+            hip_angle = self.smoothed(self.angle_window, knee_angle)
+            angle = self.smoothed(self.angle_window, knee_angle)
+            self.think.update_state_sit_stand(hip_angle, angle)
+
+        self.frames += 1
+        self.min_angle = angle if self.min_angle is None else min(self.min_angle, angle)
+        self.max_angle = angle if self.max_angle is None else max(self.max_angle, angle)
+
+        if self.think.state != previous_state:
+            return self.think.state, self.act.rep_count, angle
+        return None
+
+    def summary(self):
+        """
+        Returns the session analytics as a dictionary.
+        """
+        return {
+            'exercise': self.exercise_type,
+            'frames': self.frames,
+            'reps': self.act.rep_count,
+            'duration': time.time() - self.started,
+            'min_angle': self.min_angle,
+            'max_angle': self.max_angle
+        }
+
+
+class StreamServer:
+
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, flexion_threshold=90, extension_threshold=120):
+        """
+        Asyncio service hosting one LandmarkSession per connected client.
+        """
+        self.host = host
+        self.port = port
+        self.flexion_threshold = flexion_threshold
+        self.extension_threshold = extension_threshold
+
+        self.server = None
+        self.sessions = {}  # Active sessions by peer address
+        self.finished = deque(maxlen=FINISHED_SESSIONS)  # Summaries of the most recent closed sessions
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        # Pick up the real port when started with port 0
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        print(f"Landmark stream server listening on {self.host}:{self.port}")
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """
+        Reads the hello and then fixed-size frames until the client disconnects.
+        State updates are pushed back as soon as a frame changes the state.
+        """
+        peer = writer.get_extra_info('peername')
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        session = None
+        try:
+            (exercise_index,) = HELLO.unpack(await reader.readexactly(HELLO.size))
+            if exercise_index >= len(EXERCISES):
+                print(f"Error: Unknown exercise {exercise_index} from {peer}")
+                return
+
+            session = LandmarkSession(EXERCISES[exercise_index], self.flexion_threshold, self.extension_threshold)
+            self.sessions[peer] = session
+
+            while True:
+                frame = FRAME.unpack(await reader.readexactly(FRAME.size))
+                update = session.process(frame[1:])
+                if update is not None:
+                    state, reps, angle = update
+                    writer.write(UPDATE.pack(frame[0], STATES.index(state), reps, angle))
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Client went away
+        finally:
+            if session is not None:
+                self.sessions.pop(peer, None)
+                summary = session.summary()
+                self.finished.append(summary)
+                angle_range = f"{summary['min_angle']:.0f}-{summary['max_angle']:.0f}" if summary['frames'] else "n/a"
+                print(f"Session closed {peer}: {summary['exercise']}, {summary['reps']} reps, "
+                      f"{summary['frames']} frames in {summary['duration']:.1f}s, angle range {angle_range}")
+            writer.close()
+
+
+class LandmarkClient:
+
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, exercise_type='arm'):
+        """
+        Blocking client used by the kiosk loop in split mode.
+        """
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.sendall(HELLO.pack(EXERCISES.index(exercise_type)))
+
+        self.frame_number = 0
+        self.buffer = b''
+
+    def send_landmarks(self, sense, landmarks):
+        """
+        Sends the joints of one frame of Mediapipe landmarks.
+        """
+        values = []
+        for joint in JOINTS:
+            values.extend(sense.extract_joint_coordinates(landmarks, joint))
+        self.frame_number += 1
+        self.sock.sendall(FRAME.pack(self.frame_number, *values))
+
+    def poll_updates(self):
+        """
+        Returns the state updates received so far as (frame, state, reps, angle) tuples.
+        Does not block.
+        """
+        while select.select([self.sock], [], [], 0)[0]:
+            data = self.sock.recv(4096)
+            if not data:
+                raise ConnectionError("Landmark stream server closed the connection")
+            self.buffer += data
+
+        updates = []
+        while len(self.buffer) >= UPDATE.size:
+            frame_number, state_index, reps, angle = UPDATE.unpack_from(self.buffer)
+            updates.append((frame_number, STATES[state_index], reps, angle))
+            self.buffer = self.buffer[UPDATE.size:]
+        return updates
+
+    def close(self):
+        self.sock.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m coach.Stream", description="Run the landmark stream server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(StreamServer(args.host, args.port).serve_forever())
+    except KeyboardInterrupt:
+        pass
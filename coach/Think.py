@@ -4,10 +4,13 @@ from transitions import Machine
 
 class Think(object):
 
-    def __init__(self, act_component, exercise_type='arm', flexion_threshold=90, extension_threshold=120):
+    def __init__(self, act_component, exercise_type='arm', flexion_threshold=90, extension_threshold=120, debug=True):
         """
         Initializes a state machine based on the exercise type (arm, leg, or sit-stand).
+        Debug prints can be turned off when many sessions run in one process.
         """
+        self.debug = debug
+
         # Define thresholds based on exercise type
         self.flexion_threshold = flexion_threshold  # Flexion threshold for arm
         self.extension_threshold = extension_threshold  # Extension threshold for arm
@@ -53,14 +56,16 @@ class Think(object):
     def handle_sit(self):
         """Handles actions when sitting occurs."""
         self.act_component.visual_feedback('Sitting!')
-        print("Sitting detected!")  # Debugging print
+        if self.debug:
+            print("Sitting detected!")  # Debugging print
         # Update the rocket and reps when the user sits
         self.act_component.handle_rep_increase()
 
     def handle_stand(self):
         """Handles actions when standing occurs."""
         self.act_component.visual_feedback('Standing!')
-        print("Standing detected!")  # Debugging print
+        if self.debug:
+            print("Standing detected!")  # Debugging print
         # Update the rocket and reps when the user stands
         self.act_component.handle_rep_increase()
 
@@ -75,7 +80,8 @@ class Think(object):
 
     # Method to update state based on sit-stand motion
     def update_state_sit_stand(self, hip_angle, knee_angle):
-        print(f"Debug: hip_angle={hip_angle}, knee_angle={knee_angle}, current state={self.state}")  # Debugging
+        if self.debug:
+            print(f"Debug: hip_angle={hip_angle}, knee_angle={knee_angle}, current state={self.state}")  # Debugging
         if hip_angle > self.extension_threshold and knee_angle > self.extension_threshold:
             if self.state == 'sitting':
                 self.stand()  # Move to standing state
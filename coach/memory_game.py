@@ -5,12 +5,14 @@ import requests
 from io import BytesIO
 from PIL import Image
 import pyttsx3  # For text-to-speech
+from PhraseCache import PhraseCache  # coach/ is on the path when run as a script
 import tkinter as tk
 from tkinter import messagebox
 
 # Initialize pygame and pyttsx3
 pygame.init()
 tts_engine = pyttsx3.init()
+tts_voice = PhraseCache(tts_engine)
 
 # Constants
 SCREEN_WIDTH = 700
@@ -24,6 +26,15 @@ BLACK = (0, 0, 0)
 BUTTON_HEIGHT = 40
 TIMER_LIMIT = 200
 
+# Fixed spoken prompts, rendered ahead of time by the phrase cache
+SPOKEN_PHRASES = [
+    "Welcome to the memory puzzle game, Eleanor! Match the cards and let's see how sharp your memory is!",
+    "Game restarted! Let's go again, Eleanor!",
+    "Good job, Eleanor! You found a match!",
+    "Congratulations Eleanor! You found all the pairs!",
+    "Time's up, Eleanor! Let's try again."
+]
+
 # URLs for new images
 image_urls = [
     "https://img.icons8.com/color/48/000000/apple.png",
@@ -92,8 +103,7 @@ def start_game_window(root):
 
     # Function for TTS
     def speak(text):
-        tts_engine.say(text)
-        tts_engine.runAndWait()
+        tts_voice.say(text)
 
     # Function to check if a point is within a rectangle
     def point_in_rect(point, rect):
@@ -124,6 +134,7 @@ def start_game_window(root):
         screen.blit(message_text, text_rect)
 
     # TTS Intro and instructions
+    tts_voice.render(SPOKEN_PHRASES)
     speak("Welcome to the memory puzzle game, Eleanor! Match the cards and let's see how sharp your memory is!")
 
     # Main game loop
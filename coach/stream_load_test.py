@@ -0,0 +1,187 @@
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+# Let `python coach/stream_load_test.py` find the coach package, the same as `python -m coach.stream_load_test`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if not __package__:
+    sys.path.insert(0, ROOT)
+
+from coach.Stream import HELLO, FRAME, UPDATE, EXERCISES, DEFAULT_PORT
+
+# Load test: simulate many kiosks streaming landmarks to one server on localhost
+
+
+def simulated_frame(t, period, phase):
+    """
+    Builds one frame of joint coordinates for a left arm that flexes and extends.
+    The elbow angle sweeps between about 40 and 170 degrees, so reps get counted.
+    """
+    elbow = (0.5, 0.5)
+    shoulder = (0.5, 0.3)
+    angle = math.radians(105 + 65 * math.sin(2 * math.pi * t / period + phase))
+    wrist = (elbow[0] + 0.2 * math.sin(angle), elbow[1] - 0.2 * math.cos(angle))
+    hip, knee, ankle = (0.5, 0.7), (0.5, 0.85), (0.5, 1.0)
+
+    values = []
+    for x, y in (shoulder, elbow, wrist, hip, knee, ankle):
+        values.extend((x + random.gauss(0, 0.002), y + random.gauss(0, 0.002)))
+    return values
+
+
+async def run_stream(host, port, fps, duration, go, results):
+    """
+    One simulated client: connects, waits for the go signal so all streams send
+    at the same time, then sends frames at a fixed rate and times the updates.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(HELLO.pack(EXERCISES.index('arm')))
+    await go.wait()
+
+    sent_at = {}
+    latencies = []
+    reps = 0
+
+    async def receive():
+        nonlocal reps
+        try:
+            while True:
+                frame_number, _, rep_count, _ = UPDATE.unpack(await reader.readexactly(UPDATE.size))
+                sent = sent_at.pop(frame_number, None)
+                if sent is not None:
+                    latencies.append(time.perf_counter() - sent)
+                reps = rep_count
+        except asyncio.IncompleteReadError:
+            pass
+
+    receiver = asyncio.create_task(receive())
+
+    period = random.uniform(1.5, 3.0)
+    phase = random.uniform(0, 2 * math.pi)
+    interval = 1.0 / fps
+    start = time.perf_counter()
+    frame_number = 0
+    late_frames = 0
+
+    last_send = start
+    while time.perf_counter() - start < duration:
+        frame_number += 1
+        now = time.perf_counter()
+        # Keep only recent send times; updates arrive well within a second
+        sent_at[frame_number] = now
+        sent_at.pop(frame_number - 2 * fps, None)
+        writer.write(FRAME.pack(frame_number, *simulated_frame(now - start, period, phase)))
+        await writer.drain()
+        last_send = time.perf_counter()
+
+        delay = start + frame_number * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            late_frames += 1
+
+    writer.close()
+    await writer.wait_closed()
+    await receiver
+
+    results.append({'frames': frame_number, 'late_frames': late_frames, 'latencies': latencies, 'reps': reps,
+                    'last_send': last_send})
+
+
+def percentile(values, fraction):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server_process(port):
+    """
+    Starts the stream server in its own process, so the measurement is not
+    sharing an event loop or CPU core with the simulated clients.
+    """
+    process = subprocess.Popen([sys.executable, '-m', 'coach.Stream', '--port', str(port)],
+                               cwd=ROOT, stdout=subprocess.DEVNULL)
+
+    # Wait until it accepts connections
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Landmark stream server exited during startup")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+
+    process.kill()
+    raise RuntimeError("Landmark stream server did not start")
+
+
+async def load_test(clients, fps, duration, host=None, port=DEFAULT_PORT):
+    """
+    Runs the simulated clients against a server and prints throughput and latency.
+    Without a host, a server is started in a separate process on a free port.
+    Throughput is measured over the sending window only, not connection setup.
+    """
+    process = None
+    if host is None:
+        host, port = '127.0.0.1', free_port()
+        process = start_server_process(port)
+
+    try:
+        results = []
+        go = asyncio.Event()
+        streams = [asyncio.create_task(run_stream(host, port, fps, duration, go, results)) for _ in range(clients)]
+
+        # Give every client time to connect before anyone sends
+        await asyncio.sleep(0.5 + clients / 1000)
+        start = time.perf_counter()
+        go.set()
+        await asyncio.gather(*streams)
+        elapsed = max(result['last_send'] for result in results) - start
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    frames = sum(result['frames'] for result in results)
+    late_frames = sum(result['late_frames'] for result in results)
+    latencies = [latency for result in results for latency in result['latencies']]
+    reps = sum(result['reps'] for result in results)
+
+    print(f"Clients: {clients} at {fps} fps for {duration}s "
+          f"({'server in a separate process' if process is not None else f'server at {host}:{port}'})")
+    print(f"Frames sent: {frames} ({frames / elapsed:.0f} frames/s over the send window, target {clients * fps} frames/s)")
+    print(f"Frames sent late: {late_frames} ({100 * late_frames / max(frames, 1):.1f}%)")
+    print(f"State updates: {len(latencies)}, reps counted: {reps}")
+    print(f"Update latency ms: p50 {1000 * percentile(latencies, 0.5):.2f}, "
+          f"p95 {1000 * percentile(latencies, 0.95):.2f}, p99 {1000 * percentile(latencies, 0.99):.2f}, "
+          f"max {1000 * max(latencies, default=float('nan')):.2f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m coach.stream_load_test",
+                                     description="Load test the landmark stream server.")
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--host', default=None, help="Server to test; starts one in a separate process if omitted")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    asyncio.run(load_test(args.clients, args.fps, args.duration, args.host, args.port))
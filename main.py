@@ -3,7 +3,10 @@ import tkinter as tk
 from tkinter import messagebox
 from tkinter import PhotoImage  # For using icons
 from PIL import Image, ImageTk
-from coach import Sense, Think, Act
+from coach import Sense, Think, Act, Capture
+from coach.PhraseCache import PhraseCache
+from coach.Stream import LandmarkClient, DEFAULT_PORT
+import argparse
 import pyttsx3
 import subprocess
 import sys
@@ -15,7 +18,7 @@ def start_memory_game():
 
 class ExerciseApp:
 
-    def __init__(self, root):
+    def __init__(self, root, server_address=None):
         self.root = root
         self.root.title("Rehabilitation Agent")
         self.root.geometry("500x600")
@@ -25,7 +28,18 @@ class ExerciseApp:
         # self.root.iconphoto(False, PhotoImage(file='path_to_icon.png'))
 
         self.exercise_choice = None
+        self.server_address = server_address  # (host, port) of a landmark stream server for split mode
         self.engine = pyttsx3.init()
+        self.voice = PhraseCache(self.engine)
+
+        # Spoken introductions for each menu choice, rendered ahead of time
+        self.intro_phrases = {
+            'arm': "You have selected the Arm exercise, Eleanor. Your task is to flex and extend your left arm repeatedly. You're going to do great!",
+            'leg': "You have selected the Leg exercise, Eleanor. Your task is to flex and extend your left leg repeatedly. Keep up the good work!",
+            'sit-stand': "You have selected the sit-stand exercise, Eleanor. Your task is to sit and stand from a chair repeatedly. Stay strong!",
+            'memory': "You have selected the memory game, Eleanor. Let's have some fun!"
+        }
+        self.voice.render(self.intro_phrases.values())
 
         # Create interface for selecting exercise type
         self.create_widgets()
@@ -73,8 +87,7 @@ class ExerciseApp:
         """Handle arm exercise selection and launch the exercise program."""
         self.exercise_choice = 'arm'
         messagebox.showinfo("Arm Exercise", "Starting Arm Exercise...")
-        self.engine.say(f"You have selected the Arm exercise, Eleanor. Your task is to flex and extend your left arm repeatedly. You're going to do great!")
-        self.engine.runAndWait()
+        self.voice.say(self.intro_phrases['arm'])
         self.root.destroy()  # Close the Tkinter window
         self.run_exercise()
 
@@ -82,8 +95,7 @@ class ExerciseApp:
         """Handle leg exercise selection and launch the exercise program."""
         self.exercise_choice = 'leg'
         messagebox.showinfo("Leg Exercise", "Starting Leg Exercise...")
-        self.engine.say(f"You have selected the Leg exercise, Eleanor. Your task is to flex and extend your left leg repeatedly. Keep up the good work!")
-        self.engine.runAndWait()
+        self.voice.say(self.intro_phrases['leg'])
         self.root.destroy()  # Close the Tkinter window
         self.run_exercise()
 
@@ -91,15 +103,13 @@ class ExerciseApp:
         """Handle sit-stand exercise selection and launch the exercise program."""
         self.exercise_choice = 'sit-stand'
         messagebox.showinfo("Sit-Stand Exercise", "Starting Sit-Stand Exercise...")
-        self.engine.say(f"You have selected the sit-stand exercise, Eleanor. Your task is to sit and stand from a chair repeatedly. Stay strong!")
-        self.engine.runAndWait()
+        self.voice.say(self.intro_phrases['sit-stand'])
         self.root.destroy()  # Close the Tkinter window
         self.run_exercise()
 
     def start_memory_game(self):
         """Launch the memory game."""
-        self.engine.say(f"You have selected the memory game, Eleanor. Let's have some fun!")
-        self.engine.runAndWait()
+        self.voice.say(self.intro_phrases['memory'])
         self.root.destroy()  # Close the current window
         start_memory_game()
 
@@ -108,14 +118,27 @@ class ExerciseApp:
         # Initialize components
         sense = Sense.Sense()
         act = Act.Act()
-        think = Think.Think(act, exercise_type=self.exercise_choice)
 
-        # Initialize the webcam
-        cap = cv2.VideoCapture(0)
+        # Initialize the webcam with the best capture profile for it
+        cap = Capture.open_camera(0)
         if not cap.isOpened():
             print("Error: Unable to open the webcam.")
             return
 
+        # In split mode the server runs Think and pushes back state updates
+        client = None
+        if self.server_address is None:
+            think = Think.Think(act, exercise_type=self.exercise_choice)
+        else:
+            try:
+                client = LandmarkClient(*self.server_address, exercise_type=self.exercise_choice)
+            except OSError as e:
+                print(f"Error: Unable to reach the landmark stream server: {e}")
+                cap.release()
+                return
+            remote_state = 'standing' if self.exercise_choice == 'sit-stand' else 'neutral'
+            remote_angle = 0.0
+
         # Main loop to process video frames
         while cap.isOpened():
             ret, frame = cap.read()
@@ -132,7 +155,18 @@ class ExerciseApp:
             landmarks = joints.pose_landmarks
 
             try:
-                if self.exercise_choice == 'arm':
+                if client is not None:
+                    # Stream the joints and catch up with the reps counted on the server
+                    client.send_landmarks(sense, landmarks)
+                    for _, remote_state, reps, remote_angle in client.poll_updates():
+                        act.visual_feedback(remote_state)
+                        while act.rep_count < reps and not act.rocket_launched:
+                            act.handle_rep_increase()
+
+                    act.provide_feedback(remote_state, frame, joints, remote_angle)
+                    act.visualize_rocket()
+
+                elif self.exercise_choice == 'arm':
                     # Left arm joint coordinates
                     shoulder = sense.extract_joint_coordinates(landmarks, 'left_shoulder')
                     elbow = sense.extract_joint_coordinates(landmarks, 'left_elbow')
@@ -172,11 +206,15 @@ class ExerciseApp:
                     # Update the state machine based on the sit-stand angles
                     think.update_state_sit_stand(hip_angle_mvg, knee_angle_mvg)
 
-                # Act: Provide feedback and visualize rocket progress based on the state
-                decision = think.state
-                act.provide_feedback(decision, frame, joints, elbow_angle_mvg if self.exercise_choice == 'arm' else knee_angle_mvg)
-                act.visualize_rocket()
+                if client is None:
+                    # Act: Provide feedback and visualize rocket progress based on the state
+                    decision = think.state
+                    act.provide_feedback(decision, frame, joints, elbow_angle_mvg if self.exercise_choice == 'arm' else knee_angle_mvg)
+                    act.visualize_rocket()
 
+            except ConnectionError as e:
+                print(f"Error: Lost the landmark stream server: {e}")
+                break
             except Exception as e:
                 print(f"Error during processing: {e}")
                 continue
@@ -186,11 +224,23 @@ class ExerciseApp:
                 break
 
         # Release resources
+        if client is not None:
+            client.close()
         cap.release()
         cv2.destroyAllWindows()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rehabilitation Agent")
+    parser.add_argument('--server', default=None,
+                        help="host[:port] of a landmark stream server; runs Think locally if omitted")
+    args = parser.parse_args()
+
+    server_address = None
+    if args.server:
+        host, _, port = args.server.partition(':')
+        server_address = (host, int(port) if port else DEFAULT_PORT)
+
     root = tk.Tk()
-    app = ExerciseApp(root)
+    app = ExerciseApp(root, server_address)
     root.mainloop()